@@ -1,11 +1,15 @@
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 import os
+import io
 import json
 from json.decoder import JSONDecodeError
 import subprocess
-from functools import partial
-from translate import traduire
+import threading
+from collections import OrderedDict
+from contextlib import redirect_stdout, redirect_stderr
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import re
 import logging
 import traceback
@@ -24,6 +28,13 @@ from error_utils import (
     show_file_error,
 )
 
+# Optionnel : orjson accélère la lecture des fichiers de défauts ; json reste utilisé sinon
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Créer le dossier logs s'il n'existe pas
 os.makedirs('logs', exist_ok=True)
 
@@ -63,6 +74,11 @@ FONT_TITLE   = ("Segoe UI", 14, "bold")
 
 MIN_COL_WIDTH = 400
 
+# Nombre de fichiers JSON gardés en mémoire pour la navigation hiérarchique
+FILE_CACHE_SIZE = 64
+ROW_BINDTAG = "FaultRow"  # Bindtag commun à toutes les lignes de défauts
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))  # Dossier des scripts externes, calculé une fois
+
 # Styles pour les alarmes
 ALARM_STYLES = {
     "error": {"bg": "#f44336", "fg": "#ffffff"},
@@ -71,6 +87,36 @@ ALARM_STYLES = {
     "success": {"bg": "#4caf50", "fg": "#ffffff"}
 }
 
+@lru_cache(maxsize=4096)
+def _path_to_filename(path, lang):
+    """Nom du fichier JSON d'un chemin (tuple d'ids) ; mémorisé car recalculé à chaque navigation"""
+    if len(path) == 4:
+        # Cas courant (chemin à 4 niveaux) : un seul f-string, sans générateur ni join
+        a, b, c, d = path
+        return f"faults_{a:03d}_{b:03d}_{c:03d}_{d:03d}_{lang}.json"
+    return f"faults_{'_'.join(f'{p:03d}' for p in path)}_{lang}.json"
+
+def read_json(filepath):
+    """Lit un fichier JSON UTF-8, avec orjson s'il est disponible.
+
+    orjson.JSONDecodeError hérite de json.JSONDecodeError : la gestion d'erreurs reste la même.
+    """
+    if ORJSON_AVAILABLE:
+        with open(filepath, "rb") as f:
+            return orjson.loads(f.read())
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def traduire(text, target_lang):
+    """Traduit un texte via translate.traduire.
+
+    Le module translate (client OpenAI) est importé au premier appel seulement :
+    son import coûte près d'une seconde au démarrage alors que la traduction
+    n'est utilisée que depuis l'éditeur JSON plat.
+    """
+    from translate import traduire as _traduire
+    return _traduire(text, target_lang)
+
 class FaultEditor:
     def __init__(self, root):
         logger.info("Démarrage de l'application Fault Editor")
@@ -89,9 +135,19 @@ class FaultEditor:
         self.current_search_index = -1  # Index actuel dans les résultats
         self.search_mode = "hierarchical"  # Mode de recherche (hierarchical ou flat)
         self.search_frame = None  # Frame pour la barre de recherche
+        self.highlighted_row = None  # Ligne actuellement surlignée par la recherche
         self.current_file_path = None  # Chemin du fichier actuellement sélectionné
         self.json_data = None  # Données JSON actuellement chargées
         self.current_file = None  # Nom du fichier actuellement chargé
+        self.pending_click_job = None  # Identifiant du after() du clic simple en attente
+        self.pending_click_args = None  # Arguments du clic simple en attente
+        self.status_dots = {}  # Images des pastilles d'état, partagées par toutes les lignes
+        self.file_cache = OrderedDict()  # chemin -> ((mtime_ns, taille), contenu), ordre LRU
+        self.file_cache_lock = threading.Lock()  # Le cache est aussi utilisé par le thread d'E/S
+        self.io_executor = ThreadPoolExecutor(max_workers=1)  # Lecture des fichiers hors du thread Tk
+        self.pending_load = None  # Future du dernier chargement de niveau lancé en arrière-plan
+        self.columns_configure_job = None  # after() regroupant les <Configure> de columns_frame
+        self.content_height = 0  # Hauteur du contenu scrollable, relevée par update_scrollregion
         # Ne pas charger de dossier par défaut, attendre que l'utilisateur ouvre un dossier
         self.setup_ui()
 
@@ -104,10 +160,22 @@ class FaultEditor:
                     self.file_map[file] = os.path.join(root_dir, file)
         logger.info(f"Total : {len(self.file_map)} fichiers JSON trouvés dans {folder}")
 
+    def configure_styles(self):
+        """Configure une seule fois les styles ttk utilisés par l'interface"""
+        self.style = ttk.Style(self.root)
+        self.style.configure('TRadiobutton', font=FONT_TOPBAR)
+        self.style.configure('TButton', font=FONT_TOPBAR)
+        self.style.configure("Custom.Vertical.TScrollbar",
+                             background=COL_BG_MAIN,
+                             troughcolor=COL_BG_MAIN,
+                             arrowcolor="white")
+        self.style.configure("Custom.Horizontal.TScrollbar",
+                             background=COL_BG_MAIN,
+                             troughcolor=COL_BG_MAIN,
+                             arrowcolor="white")
+
     def setup_ui(self):
-        style = ttk.Style()
-        style.configure('TRadiobutton', font=FONT_TOPBAR)
-        style.configure('TButton', font=FONT_TOPBAR)
+        self.configure_styles()
 
         # Barre supérieure avec logo
         topbar = tk.Frame(self.root, bg=COL_BG_TOPBAR, height=60)
@@ -191,17 +259,6 @@ class FaultEditor:
         self.status = tk.Label(self.root, text="Prêt", bd=1, relief=tk.SUNKEN, anchor=tk.W, bg=COL_BG_TOPBAR, fg="white")
         self.status.pack(side=tk.BOTTOM, fill=tk.X)
 
-        # Style des scrollbars
-        style = ttk.Style()
-        style.configure("Custom.Vertical.TScrollbar",
-                       background=COL_BG_MAIN,
-                       troughcolor=COL_BG_MAIN,
-                       arrowcolor="white")
-        style.configure("Custom.Horizontal.TScrollbar",
-                       background=COL_BG_MAIN,
-                       troughcolor=COL_BG_MAIN,
-                       arrowcolor="white")
-
         # Conteneur pour le canvas et les scrollbars
         container = tk.Frame(self.root)
         container.pack(fill="both", expand=True)
@@ -229,15 +286,17 @@ class FaultEditor:
         self.columns_frame = tk.Frame(self.main_canvas, bg=COL_BG_MAIN)
         self.canvas_window = self.main_canvas.create_window((0, 0), window=self.columns_frame, anchor="nw")
 
-        # Met à jour la zone scrollable en fonction du contenu
-        self.columns_frame.bind("<Configure>", lambda e: self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all")))
-        self.columns_frame.bind("<Configure>", lambda e: self.main_canvas.itemconfig(self.canvas_window, width=self.columns_frame.winfo_reqwidth()))
+        # Met à jour la zone scrollable et la scrollbar horizontale en fonction du contenu,
+        # une seule fois par rafale d'événements <Configure>
+        self.columns_frame.bind("<Configure>", self.on_columns_configure)
         # Gère la visibilité dynamique de la scrollbar horizontale
         self.main_canvas.bind("<Configure>", self.update_xscroll_visibility)
-        self.columns_frame.bind("<Configure>", self.update_xscroll_visibility)
 
-        # On ajuste seulement la hauteur pour que le canvas prenne toute la hauteur de la fenêtre
-        self.root.bind("<Configure>", lambda e: self.main_canvas.config(height=self.root.winfo_height()))
+        # On ajuste seulement la hauteur pour que le canvas prenne toute la hauteur de la fenêtre.
+        # La liaison sur root reçoit aussi les <Configure> de tous ses descendants (lignes, colonnes) :
+        # seuls ceux de la fenêtre elle-même sont pris en compte.
+        self.root.bind("<Configure>", self.on_root_configure)
+        self.root.bind("<Destroy>", self.on_root_destroy, add="+")
 
         # Binding de la molette pour le scroll vertical
         def on_mousewheel(event):
@@ -252,18 +311,24 @@ class FaultEditor:
         self.root.unbind_all("<MouseWheel>")
         self.root.bind_all("<MouseWheel>", on_mousewheel)
 
-        # Améliore la gestion du focus
+        # Améliore la gestion du focus.
+        # bind_class("Entry") ne déclenche ces fonctions que pour les widgets de classe Tk "Entry" :
+        # le type est déjà garanti par Tk, sans test isinstance par événement.
         def on_focus_in(event):
-            if isinstance(event.widget, tk.Entry):
-                event.widget.config(bg=COL_EDIT_BG_FOCUS)
+            event.widget.config(bg=COL_EDIT_BG_FOCUS)
 
         def on_focus_out(event):
-            if isinstance(event.widget, tk.Entry):
-                event.widget.config(bg=COL_EDIT_BG)
+            event.widget.config(bg=COL_EDIT_BG)
 
         self.root.bind_class("Entry", "<FocusIn>", on_focus_in)
         self.root.bind_class("Entry", "<FocusOut>", on_focus_out)
 
+        # Événements des lignes de défauts : liés une seule fois à la classe FaultRow
+        self.root.bind_class(ROW_BINDTAG, "<Enter>", lambda e: e.widget.configure(highlightthickness=1))
+        self.root.bind_class(ROW_BINDTAG, "<Leave>", lambda e: e.widget.configure(highlightthickness=0))
+        self.root.bind_class(ROW_BINDTAG, "<Button-1>", self.on_row_click)
+        self.root.bind_class(ROW_BINDTAG, "<Double-1>", self.on_row_double_click)
+
         # Binding des événements pour une meilleure gestion de la navigation
         self.root.bind("<Control-r>", lambda e: self.reload_root())
         self.root.bind("<Escape>", lambda e: self.unmake_editable())
@@ -299,6 +364,28 @@ class FaultEditor:
             logger.error(f"Erreur inattendue lors du rechargement : {e}")
             self.status.config(text="❌ Erreur de rechargement")
 
+    def on_root_configure(self, event):
+        """Redimensionne le canvas quand la fenêtre principale change de taille"""
+        if event.widget is self.root:
+            self.main_canvas.config(height=event.height)
+
+    def on_root_destroy(self, event):
+        """Arrête le thread de lecture des fichiers quand la fenêtre principale est détruite"""
+        if event.widget is self.root:
+            self.pending_load = None
+            self.io_executor.shutdown(wait=False, cancel_futures=True)
+
+    def on_columns_configure(self, event=None):
+        """Regroupe les redimensionnements de columns_frame en une seule mise à jour"""
+        if self.columns_configure_job is None:
+            self.columns_configure_job = self.root.after(50, self.apply_columns_configure)
+
+    def apply_columns_configure(self):
+        """Met à jour la zone scrollable et la scrollbar horizontale après un redimensionnement"""
+        self.columns_configure_job = None
+        self.update_scrollregion()
+        self.update_xscroll_visibility()
+
     def update_xscroll_visibility(self, event=None):
         # Affiche ou masque la scrollbar horizontale selon la largeur du contenu
         canvas_width = self.main_canvas.winfo_width()
@@ -378,7 +465,7 @@ class FaultEditor:
 
     def run_check_coherence(self):
         """Mashup complet : Cohérence + Orthographe + Headers - Version optimisée"""
-        if not hasattr(self, 'file_map') or not self.file_map:
+        if not getattr(self, 'file_map', None):
             self.status.config(text="❌ Aucun dossier ouvert")
             return
 
@@ -516,7 +603,7 @@ class FaultEditor:
     def run_coherence_check_step(self, dossier_base, apply_fix):
         """Étape de vérification de cohérence"""
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
+            script_dir = SCRIPT_DIR
 
             # Commande de base
             cmd = ["python", os.path.join(script_dir, "check_coherence.py"), dossier_base]
@@ -557,35 +644,30 @@ class FaultEditor:
     def run_spelling_check_step(self, dossier_base):
         """Étape de vérification orthographique"""
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            cmd = ["python", os.path.join(script_dir, "verifier_orthographe.py"), dossier_base]
+            # Exécutée dans le processus courant et en séquentiel (--jobs 1) : ni nouvel
+            # interpréteur ni pool de processus lancé depuis l'interface Tk
+            import verifier_orthographe
 
-            env = os.environ.copy()
-            env["PYTHONIOENCODING"] = "utf-8"
-
-            result = subprocess.run(cmd, capture_output=True, text=True,
-                                  encoding="utf-8", errors="replace", env=env, cwd=script_dir)
+            output, errors = io.StringIO(), io.StringIO()
+            with redirect_stdout(output), redirect_stderr(errors):
+                returncode = verifier_orthographe.main([dossier_base, "--jobs", "1"])
+            output, errors = output.getvalue(), errors.getvalue()
 
-            if result.stdout:
+            if output:
                 logger.info("Résultats de la vérification orthographique reçus")
                 print("📝 Résultats orthographe :")
-                print(result.stdout)
+                print(output)
 
             return {
-                'success': result.returncode == 0,
-                'output': result.stdout,
-                'errors': result.stderr
+                'success': returncode == 0,
+                'output': output,
+                'errors': errors
             }
 
-        except subprocess.SubprocessError as e:
-            logger.error(f"Erreur subprocess lors de la vérification orthographique : {e}")
-            traceback.print_exc()
-            print(f"❌ Erreur subprocess lors de la vérification orthographique : {e}")
-            return {'success': False, 'output': '', 'errors': str(e)}
-        except FileNotFoundError as e:
-            logger.error(f"Script verifier_orthographe.py introuvable : {e}")
+        except ImportError as e:
+            logger.error(f"Module verifier_orthographe introuvable : {e}")
             traceback.print_exc()
-            print(f"❌ Script verifier_orthographe.py introuvable : {e}")
+            print(f"❌ Module verifier_orthographe introuvable : {e}")
             return {'success': False, 'output': '', 'errors': str(e)}
         except PermissionError as e:
             logger.error(f"Erreur d'accès lors de la vérification orthographique : {e}")
@@ -601,7 +683,7 @@ class FaultEditor:
     def run_headers_fix_step(self, dossier_base):
         """Étape de correction des headers"""
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
+            script_dir = SCRIPT_DIR
             cmd = ["python", os.path.join(script_dir, "fix_headers.py"), dossier_base]
 
             env = os.environ.copy()
@@ -768,7 +850,7 @@ class FaultEditor:
 
         try:
             # Obtenir le chemin du dossier contenant app.py
-            script_dir = os.path.dirname(os.path.abspath(__file__))
+            script_dir = SCRIPT_DIR
 
             # Modifier la commande pour inclure le chemin complet du script
             if cmd[0] == "python":
@@ -878,7 +960,7 @@ class FaultEditor:
     def run_spell_check(self):
         """Lance la vérification orthographique des fichiers"""
         try:
-            if not hasattr(self, 'file_map') or not self.file_map:
+            if not getattr(self, 'file_map', None):
                 logger.warning("Tentative de vérification orthographique sans dossier ouvert")
                 self.status.config(text="❌ Aucun dossier ouvert")
                 return
@@ -918,7 +1000,7 @@ class FaultEditor:
         popup = self.afficher_popup_chargement(f"{desc} en cours...")
         try:
             # Obtenir le chemin du dossier contenant app.py
-            script_dir = os.path.dirname(os.path.abspath(__file__))
+            script_dir = SCRIPT_DIR
 
             # Modifier la commande pour inclure le chemin complet du script
             if cmd[0] == "python":
@@ -1028,7 +1110,7 @@ class FaultEditor:
             print(f"📂 Répertoire de travail pour la synchronisation : {source_dir}")
 
             # Vérification du script
-            script_dir = os.path.dirname(os.path.abspath(__file__))
+            script_dir = SCRIPT_DIR
             script_path = os.path.join(script_dir, "sync_one.py")
             if not os.path.exists(script_path):
                 msg = f"❌ Script de synchronisation introuvable: {script_path}"
@@ -1198,7 +1280,7 @@ class FaultEditor:
             print(msg)
 
     def check_required_files(self):
-        script_dir = os.path.dirname(os.path.abspath(__file__))
+        script_dir = SCRIPT_DIR
         required_files = ["sync_one.py", "generer_fichier.py", "translate.py"]
 
         missing_files = []
@@ -1215,6 +1297,9 @@ class FaultEditor:
 
     # --- Navigation et chargement des colonnes ---
     def reload_lang(self):
+        # Re-sélectionner la langue déjà affichée ne doit pas reconstruire toutes les colonnes
+        if self.lang_var.get() == self.lang:
+            return
         self.lang = self.lang_var.get()
         print(f"Changement de langue : {self.lang}")
         # Clear any active editing state before rebuilding UI
@@ -1258,6 +1343,28 @@ class FaultEditor:
         self.load_level(self.current_path, 0)
 
     def load_level(self, path, level):
+        # Un chargement synchrone remplace tout chargement en arrière-plan encore en cours
+        self.pending_load = None
+        filename = self.path_to_filename(path)
+        logger.info(f"Chargement du niveau {level} avec le fichier : {filename}")
+        filepath = self.file_map.get(filename)
+        if not filepath:
+            logger.error(f"Fichier introuvable : {filename}")
+            self.status.config(text=f"❌ Introuvable : {filename}")
+            return
+        try:
+            content = self.load_json_cached(filepath)
+            logger.info(f"Fichier {filename} chargé avec succès")
+        except (OSError, ValueError) as e:
+            # OSError : fichier absent, droits, dossier... ValueError : JSON invalide
+            # (json et orjson) ou encodage (UnicodeDecodeError)
+            logger.error(f"Erreur lors de la lecture de {filename}: {str(e)}")
+            self.status.config(text=f"❌ Erreur lecture {filename}")
+            return
+        self.show_level(content, path, level, filename, filepath)
+
+    def load_level_async(self, path, level):
+        """Lit le fichier d'un niveau dans le thread d'E/S, puis l'affiche depuis le thread Tk"""
         filename = self.path_to_filename(path)
         logger.info(f"Chargement du niveau {level} avec le fichier : {filename}")
         filepath = self.file_map.get(filename)
@@ -1265,23 +1372,61 @@ class FaultEditor:
             logger.error(f"Fichier introuvable : {filename}")
             self.status.config(text=f"❌ Introuvable : {filename}")
             return
+        self.status.config(text=f"⏳ Chargement de {filename}...")
+        future = self.io_executor.submit(self.load_json_cached, filepath)
+        self.pending_load = future
+        self.root.after(20, self.poll_level_load, future, path[:], level, filename, filepath)
+
+    def poll_level_load(self, future, path, level, filename, filepath):
+        """Attend (sans bloquer Tk) la fin d'un chargement lancé par load_level_async"""
+        if future is not self.pending_load:
+            # Une navigation plus récente a remplacé ce chargement
+            return
+        if not future.done():
+            self.root.after(20, self.poll_level_load, future, path, level, filename, filepath)
+            return
+        self.pending_load = None
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = json.load(f)
+            content = future.result()
             logger.info(f"Fichier {filename} chargé avec succès")
-        except (FileNotFoundError, json.JSONDecodeError, PermissionError) as e:
+        except (OSError, ValueError) as e:
+            # OSError : fichier absent, droits, dossier... ValueError : JSON invalide
+            # (json et orjson) ou encodage (UnicodeDecodeError)
             logger.error(f"Erreur lors de la lecture de {filename}: {str(e)}")
             self.status.config(text=f"❌ Erreur lecture {filename}")
             return
+        self.status.config(text=f"✅ {filename} chargé")
+        self.show_level(content, path, level, filename, filepath)
+
+    def show_level(self, content, path, level, filename, filepath):
+        """Affiche le contenu d'un fichier chargé comme colonne du niveau donné"""
         self.data_map[filename] = content
         self.path_map[filename] = filepath
         self.clear_columns_from(level)
         fault_list = content.get("FaultDetailList", [])
         print(f"Nombre d'items dans FaultDetailList : {len(fault_list)}")
         self.display_column(fault_list, path, filename, level)
-        self.root.after(100, lambda: self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all")))
+        self.root.after(100, self.update_scrollregion)
         self.main_canvas.yview_moveto(0.0)
 
+    def load_json_cached(self, filepath):
+        """Charge un fichier JSON en réutilisant la version en mémoire si le fichier n'a pas changé"""
+        # La signature (mtime, taille) détecte les modifications faites par les scripts externes
+        stat = os.stat(filepath)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self.file_cache_lock:
+            entry = self.file_cache.get(filepath)
+            if entry is not None and entry[0] == signature:
+                self.file_cache.move_to_end(filepath)
+                return entry[1]
+        content = read_json(filepath)
+        with self.file_cache_lock:
+            self.file_cache[filepath] = (signature, content)
+            self.file_cache.move_to_end(filepath)
+            if len(self.file_cache) > FILE_CACHE_SIZE:
+                self.file_cache.popitem(last=False)
+        return content
+
     def load_json_file(self, filename):
         """Charge un fichier JSON de manière sécurisée"""
         if not filename:
@@ -1351,7 +1496,7 @@ class FaultEditor:
             raise Exception(error_msg)
 
     def path_to_filename(self, path):
-        return f"faults_{'_'.join(str(p).zfill(3) for p in path)}_{self.lang}.json"
+        return _path_to_filename(tuple(path), self.lang)
 
     # --- Gestion des clics sur les items ---
     def update_selected_file(self, fn):
@@ -1360,8 +1505,23 @@ class FaultEditor:
         self.genfichier_file_var.set(fn)
 
     def handle_single_click(self, fault, i, path, level, fn, event):
-        widget = event.widget
-        widget._click_job = widget.after(300, lambda: self.single_click_action(fault, i, path, level, fn))
+        # Un seul minuteur partagé : un nouveau clic remplace celui en attente
+        self.cancel_pending_click()
+        self.pending_click_args = (fault, i, path, level, fn)
+        self.pending_click_job = self.root.after(300, self.run_pending_click)
+
+    def cancel_pending_click(self):
+        if self.pending_click_job is not None:
+            self.root.after_cancel(self.pending_click_job)
+        self.pending_click_job = None
+        self.pending_click_args = None
+
+    def run_pending_click(self):
+        args = self.pending_click_args
+        self.pending_click_job = None
+        self.pending_click_args = None
+        if args:
+            self.single_click_action(*args)
 
     def single_click_action(self, fault, i, path, level, fn):
         self.update_selected_file(fn)
@@ -1381,10 +1541,26 @@ class FaultEditor:
             if insert_idx + 1 < len(new_path):
                 new_path[insert_idx + 1] = 255
             self.current_path = new_path
-            print(f"Navigation vers {self.path_to_filename(new_path)}")
-            self.load_level(new_path, level + 1)
+            filename = self.path_to_filename(new_path)
+            print(f"Navigation vers {filename}")
+            # Le niveau suivant affiche déjà ce fichier, inchangé sur disque (même signature
+            # dans le cache) : seules les colonnes plus profondes changent
+            if len(self.columns) > level + 1 and self.columns[level + 1]._filename == filename:
+                filepath = self.file_map.get(filename)
+                try:
+                    a_jour = filepath is not None and self.load_json_cached(filepath) is self.data_map.get(filename)
+                except (OSError, ValueError):
+                    a_jour = False
+                if a_jour:
+                    self.pending_load = None
+                    self.status.config(text=f"✅ {filename} chargé")
+                    self.clear_columns_from(level + 2)
+                    return
+            self.load_level_async(new_path, level + 1)
 
     def handle_double_click(self, fault, i, path, level, fn, row, event):
+        # Le double-clic annule la navigation du clic simple qui le précède
+        self.cancel_pending_click()
         if self.editing_info and self.editing_info["row"] != row:
             self.unmake_editable()
         self.editing_info = {"row": row, "fault": fault, "idx": i, "filename": fn, "path": path, "level": level}
@@ -1395,45 +1571,104 @@ class FaultEditor:
     def display_column(self, fault_list, path, filename, level):
         col_index = len(self.columns)
         frame = tk.Frame(self.columns_frame, bg=COL_BG_COLUMN)
-        frame.grid(row=0, column=col_index, padx=5, pady=10, sticky="nsew")
-        self.columns_frame.grid_columnconfigure(col_index, minsize=MIN_COL_WIDTH)
         self.columns.append(frame)
-        for idx, fault in enumerate(fault_list):
-            row = tk.Frame(frame, bg=COL_BG_ROW, highlightthickness=0, highlightbackground=COL_HIGHLIGHT)
+        # Contexte de la colonne, partagé par toutes ses lignes (au lieu d'une closure par ligne)
+        frame._faults = fault_list  # type: ignore
+        frame._path = list(path)  # type: ignore
+        frame._level = level  # type: ignore
+        frame._filename = filename  # type: ignore
+        frame._rows = []  # type: ignore
+        # Colonnes parallèles (descriptions, extensibilité) pour la recherche sans relire les widgets
+        frame._descriptions = [fault.get("Description") or "" for fault in fault_list]  # type: ignore
+        frame._expandable = [bool(fault.get("IsExpandable")) for fault in fault_list]  # type: ignore
+        frame._descriptions_cf = [d.casefold() for d in frame._descriptions]  # type: ignore
+        # Références lues une fois pour toute la boucle plutôt qu'à chaque ligne
+        build_row_label = self.build_row_label
+        rows = frame._rows  # type: ignore
+        for idx in range(len(fault_list)):
+            # Une ligne = un seul Label (pastille en image + description), sans Frame conteneur
+            row = build_row_label(frame, idx)
             row.pack(fill="x", padx=4, pady=3)
-            row.bind("<Enter>", lambda e, r=row: r.configure(highlightthickness=1))
-            row.bind("<Leave>", lambda e, r=row: r.configure(highlightthickness=0))
-            color = COL_GREEN if fault.get("IsExpandable") else COL_RED
-            dot = tk.Canvas(row, width=14, height=14, bg=COL_BG_ROW, highlightthickness=0)
-            dot.create_oval(2, 2, 12, 12, fill=color, outline=color)
-            dot.pack(side="left", padx=(6, 8))
-            label_text = f"{idx}: {fault.get('Description', '(vide)')}"
-            label = tk.Label(row, text=label_text, fg=COL_FG_TEXT, bg=COL_BG_ROW,
-                             anchor="w", font=FONT_DEFAULT)
-            label.pack(side="left", fill="x", expand=True)
-            label.bind("<Button-1>", partial(self.handle_single_click, fault, idx, path, level, filename))
-            label.bind("<Double-1>", partial(self.handle_double_click, fault, idx, path, level, filename, row))
+            rows.append(row)
+        # La colonne n'est placée qu'une fois remplie : un seul calcul de géométrie pour columns_frame
+        frame.grid(row=0, column=col_index, padx=5, pady=10, sticky="nsew")
+        self.columns_frame.grid_columnconfigure(col_index, minsize=MIN_COL_WIDTH)
         self.root.update_idletasks()
-        self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
+        self.update_scrollregion()
         self.main_canvas.yview_moveto(0.0)
 
+    def update_scrollregion(self):
+        """Met à jour la zone scrollable d'après la taille demandée par columns_frame"""
+        # columns_frame est le seul élément du canvas : sa taille suffit, sans parcourir bbox("all")
+        self.content_height = self.columns_frame.winfo_reqheight()
+        self.main_canvas.configure(scrollregion=(0, 0,
+                                                 self.columns_frame.winfo_reqwidth(),
+                                                 self.content_height))
+
+    def refresh_column_cache(self, column, idx, fault):
+        """Met à jour les colonnes parallèles de recherche après l'édition d'une ligne"""
+        column._descriptions[idx] = fault.get("Description") or ""
+        column._descriptions_cf[idx] = column._descriptions[idx].casefold()
+        column._expandable[idx] = bool(fault.get("IsExpandable"))
+
     def render_row(self, row, fault, idx, path, level, filename):
         """Rend un row en mode lecture seule (utile pour annuler l'édition)"""
         try:
-            for w in row.winfo_children():
-                w.destroy()
+            editor = getattr(row, "_editor", None)
+            if editor is not None:
+                # Réafficher la ligne à la place de l'éditeur
+                row.pack(fill="x", padx=4, pady=3, before=editor)
+                editor.destroy()
+                row._editor = None  # type: ignore
+            text, image = self.row_display(row.master, idx)
+            row.configure(text=text, image=image)
         except tk.TclError:
             # Widget has been destroyed (e.g., during language change), skip rendering
             return
-        color = COL_GREEN if fault.get("IsExpandable") else COL_RED
-        dot = tk.Canvas(row, width=14, height=14, bg=COL_BG_ROW, highlightthickness=0)
-        dot.create_oval(2, 2, 12, 12, fill=color, outline=color)
-        dot.pack(side="left", padx=(6,8))
-        label_text = f"{idx}: {fault.get('Description', '(vide)')}"
-        label = tk.Label(row, text=label_text, fg=COL_FG_TEXT, bg=COL_BG_ROW, anchor="w", font=FONT_DEFAULT)
-        label.pack(side="left", fill="x", expand=True)
-        label.bind("<Button-1>", partial(self.handle_single_click, fault, idx, path, level, filename))
-        label.bind("<Double-1>", partial(self.handle_double_click, fault, idx, path, level, filename, row))
+
+    def row_display(self, column, idx):
+        """Texte et pastille d'une ligne, lus dans les colonnes parallèles déjà extraites"""
+        color = COL_GREEN if column._expandable[idx] else COL_RED
+        return f"{idx}: {column._descriptions[idx] or '(vide)'}", self.status_dot(color)
+
+    def build_row_label(self, column, idx):
+        """Crée le label d'une ligne : pastille d'état (image partagée) et description"""
+        label_text, image = self.row_display(column, idx)
+        label = tk.Label(column, text=label_text, image=image, compound="left",
+                         fg=COL_FG_TEXT, bg=COL_BG_ROW, anchor="w", font=FONT_DEFAULT,
+                         highlightthickness=0, highlightbackground=COL_HIGHLIGHT)
+        label._row_index = idx  # type: ignore
+        # Les liaisons sont portées par le bindtag partagé, pas par chaque label
+        label.bindtags((ROW_BINDTAG,) + label.bindtags())
+        return label
+
+    def on_row_click(self, event):
+        """Clic sur une ligne : retrouve le défaut à partir de l'index et du contexte de la colonne"""
+        row = event.widget
+        column = row.master
+        idx = row._row_index
+        self.handle_single_click(column._faults[idx], idx, column._path, column._level, column._filename, event)
+
+    def on_row_double_click(self, event):
+        """Double-clic sur une ligne : passe la ligne en mode édition"""
+        row = event.widget
+        column = row.master
+        idx = row._row_index
+        self.handle_double_click(column._faults[idx], idx, column._path, column._level, column._filename, row, event)
+
+    def status_dot(self, color):
+        """Retourne l'image de pastille d'état pour une couleur, créée une seule fois"""
+        image = self.status_dots.get(color)
+        if image is None:
+            # 6px de marge, pastille de 14px, 8px de marge : même rendu que l'ancien Canvas par ligne.
+            # Les pixels non remplis restent transparents et prennent le fond du label.
+            image = tk.PhotoImage(master=self.root, width=28, height=14)
+            for y in range(2, 12):
+                dy = y + 0.5 - 7
+                half = (25 - dy * dy) ** 0.5
+                image.put(color, to=(round(13 - half), y, round(13 + half), y + 1))
+            self.status_dots[color] = image
+        return image
 
     def unmake_editable(self):
         """Rétablit l'ancien row en mode lecture seule."""
@@ -1448,9 +1683,12 @@ class FaultEditor:
         level = self.editing_info["level"]
 
         try:
-            # Check if the widget still exists before trying to render it
-            row.winfo_exists()
-            self.render_row(row, fault, idx, path, level, filename)
+            # Une seule vérification pour la ligne : si sa colonne a été détruite
+            # (changement de langue, navigation), il n'y a rien à réafficher
+            if row.winfo_exists():
+                self.render_row(row, fault, idx, path, level, filename)
+            else:
+                logger.debug("Widget détruit avant fin d'édition")
         except tk.TclError:
             # Widget has been destroyed (e.g., during language change)
             logger.debug("Widget détruit avant fin d'édition")
@@ -1461,35 +1699,42 @@ class FaultEditor:
     def make_editable(self, row, fault, idx, filename, path, level):
         print(f"✏️ Modification déclenchée sur l'item {idx} dans {filename}")
         try:
-            for widget in row.winfo_children():
-                widget.destroy()
+            if getattr(row, "_editor", None) is not None:
+                return
+            # L'éditeur prend la place de la ligne, qui est masquée jusqu'à la fin de l'édition
+            editor = tk.Frame(row.master, bg=COL_BG_ROW)
+            editor.pack(fill="x", padx=4, pady=3, after=row)
+            row.pack_forget()
+            row._editor = editor  # type: ignore
         except tk.TclError:
             # Widget has been destroyed (e.g., during language change), abort editing
             return
         desc_var = tk.StringVar(value=fault.get("Description", ""))
-        desc_entry = tk.Entry(row, textvariable=desc_var, bg=COL_EDIT_BG, fg=COL_EDIT_FG,
+        desc_entry = tk.Entry(editor, textvariable=desc_var, bg=COL_EDIT_BG, fg=COL_EDIT_FG,
                               highlightthickness=0, relief="flat", font=FONT_DEFAULT)
         desc_entry.pack(side="left", padx=5, fill="both", expand=True, ipady=4)
         desc_entry.focus_set()
         def save_edit(event=None):
             fault["Description"] = desc_var.get()
             fault["IsExpandable"] = exp_var.get()
+            self.refresh_column_cache(row.master, idx, fault)
             self.save_file(filename)
             self.unmake_editable()
         desc_entry.bind("<Return>", save_edit)
         exp_var = tk.BooleanVar(value=fault.get("IsExpandable", False))
-        exp_check = tk.Checkbutton(row, text="Expandable", variable=exp_var,
+        exp_check = tk.Checkbutton(editor, text="Expandable", variable=exp_var,
                                    bg=COL_BG_ROW, fg=COL_FG_TEXT, selectcolor=COL_BG_ROW,
                                    activebackground=COL_BG_ROW, highlightthickness=0, bd=0,
                                    font=FONT_DEFAULT)
         exp_check.pack(side="left", padx=5)
-        tk.Button(row, text="✅", command=save_edit,
+        tk.Button(editor, text="✅", command=save_edit,
                   bg=COL_BG_ROW, fg=COL_FG_TEXT, relief="flat", font=FONT_DEFAULT).pack(side="left", padx=5)
-        row.update_idletasks()
-        self.columns_frame.event_generate("<Configure>")
 
     def save_file(self, rel_path):
         logger.info(f"Sauvegarde du fichier: {rel_path}")
+        # Le prochain chargement relira le disque, que la sauvegarde réussisse ou non
+        with self.file_cache_lock:
+            self.file_cache.pop(self.file_map.get(rel_path), None)
         try:
             with open(self.file_map[rel_path], "w", encoding="utf-8") as f:
                 json.dump(self.data_map[os.path.basename(rel_path)], f, indent=2, ensure_ascii=False)
@@ -1520,7 +1765,7 @@ class FaultEditor:
             frame.destroy()
         self.columns = self.columns[:level]
         self.root.update_idletasks()
-        self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
+        self.update_scrollregion()
 
     def load_flat_json(self):
         file_path = filedialog.askopenfilename(
@@ -1688,6 +1933,8 @@ class FaultEditor:
         editor_window.canvas = canvas  # type: ignore
         editor_window.all_keys = all_keys  # type: ignore
         editor_window.entry_vars = {}  # type: ignore
+        editor_window.highlighted_rows = set()  # type: ignore  # Lignes repeintes par la recherche
+        editor_window.key_labels = []  # type: ignore  # Label de clé de chaque ligne, dans l'ordre
 
         # En-têtes
         headers = ["Clé", "Français", "Anglais", "Espagnol", ""]
@@ -1713,6 +1960,7 @@ class FaultEditor:
             key_label = tk.Label(grid_frame, text=key, bg=row_color, fg=COL_FG_TEXT,
                                font=FONT_DEFAULT, anchor="w", padx=5)
             key_label.grid(row=row_idx, column=0, sticky="ew", padx=2, pady=3)
+            editor_window.key_labels.append(key_label)  # type: ignore
 
             # Colonnes traductions
             for col_idx, lang in enumerate(["fr", "en", "es"], start=1):
@@ -1823,7 +2071,7 @@ class FaultEditor:
     def show_flat_search(self, editor_window):
         """Affiche la barre de recherche pour l'éditeur de fichiers plats"""
         # Fermer la barre de recherche existante si elle existe
-        if hasattr(editor_window, 'search_frame') and editor_window.search_frame:
+        if getattr(editor_window, 'search_frame', None):
             editor_window.search_frame.destroy()
             editor_window.search_frame = None
 
@@ -1890,7 +2138,7 @@ class FaultEditor:
 
     def close_flat_search(self, editor_window):
         """Ferme la barre de recherche pour l'éditeur de fichiers plats."""
-        if hasattr(editor_window, 'search_frame') and editor_window.search_frame:
+        if getattr(editor_window, 'search_frame', None):
             editor_window.search_frame.destroy()
             editor_window.search_frame = None
         editor_window.search_results = []
@@ -1899,9 +2147,11 @@ class FaultEditor:
 
     def clear_flat_search_highlights(self, editor_window):
         """Réinitialise les surlignages de recherche dans l'éditeur de fichiers plats."""
-        for row_idx in range(1, len(editor_window.all_keys) + 1):
-            for widget in editor_window.grid_frame.grid_slaves(row=row_idx):
-                widget.config(bg=COL_BG_ROW if row_idx % 2 == 1 else COL_BG_ROW_ALT)
+        # Seules les lignes effectivement surlignées sont repeintes, avec leur couleur d'origine
+        for row_idx in editor_window.highlighted_rows:
+            row_color = COL_BG_ROW_ALT if row_idx % 2 == 1 else COL_BG_ROW
+            editor_window.key_labels[row_idx - 1].config(bg=row_color)
+        editor_window.highlighted_rows.clear()
 
     def flat_search_as_you_type(self, editor_window):
         """Recherche en temps réel dans l'éditeur de fichiers plats"""
@@ -1929,10 +2179,10 @@ class FaultEditor:
         """Met en évidence un résultat de recherche spécifique et défile jusqu'à lui si nécessaire."""
         self.clear_flat_search_highlights(editor_window)
 
-        # Mettre en surbrillance la ligne trouvée
-        for widget in editor_window.grid_frame.grid_slaves(row=row_idx):
-            if isinstance(widget, (tk.Label, tk.Canvas)):
-                widget.config(bg=COL_SEARCH_HIGHLIGHT)
+        # Mettre en surbrillance la ligne trouvée (seul le label de clé change de fond)
+        key_label = editor_window.key_labels[row_idx - 1]
+        key_label.config(bg=COL_SEARCH_HIGHLIGHT)
+        editor_window.highlighted_rows.add(row_idx)
 
         # Mettre à jour le compteur de résultats
         total_results = len(editor_window.search_results)
@@ -1941,7 +2191,7 @@ class FaultEditor:
             editor_window.results_label.config(text=f"{current_index}/{total_results}")
 
         # Calculer les coordonnées de la ligne dans le canvas
-        widget = editor_window.grid_frame.grid_slaves(row=row_idx)[0]
+        widget = key_label
         widget_y = widget.winfo_y()
         canvas_height = editor_window.canvas.winfo_height()
 
@@ -2012,7 +2262,7 @@ class FaultEditor:
 
     def translate_all(self, editor_window):
         """Traduit toutes les valeurs françaises vers l'anglais et l'espagnol"""
-        if not hasattr(editor_window, 'all_keys') or not editor_window.all_keys:
+        if not getattr(editor_window, 'all_keys', None):
             return
 
         # Confirmer l'opération
@@ -2094,14 +2344,22 @@ class FaultEditor:
 
     def show_search(self):
         """Affiche la barre de recherche pour la vue hiérarchique"""
-        # Fermer la barre de recherche existante si elle existe
-        if self.search_frame:
-            self.search_frame.destroy()
-            self.search_frame = None
+        # La barre est construite une seule fois, puis simplement réaffichée
+        if self.search_frame is None:
+            self.build_search_bar()
+        self.search_frame.pack(fill="x", after=self.tools_frame)
 
-        # Créer la barre de recherche
+        # Repartir d'un champ vide, comme à la première ouverture
+        self.search_var.set("")
+        self.search_results = []
+        self.current_search_index = -1
+
+        # Focus sur le champ de recherche
+        self.search_entry.focus_set()
+
+    def build_search_bar(self):
+        """Construit les widgets de la barre de recherche hiérarchique (une seule fois)"""
         self.search_frame = tk.Frame(self.root, bg=COL_BG_TOPBAR)
-        self.search_frame.pack(fill="x", after=self.tools_frame)
 
         # Container gauche pour le champ de recherche
         search_container = tk.Frame(self.search_frame, bg=COL_BG_TOPBAR)
@@ -2116,7 +2374,7 @@ class FaultEditor:
         search_label.pack(side="left", padx=(10, 0))
 
         self.search_var = tk.StringVar()
-        search_entry = tk.Entry(search_container, textvariable=self.search_var, width=40,
+        search_entry = self.search_entry = tk.Entry(search_container, textvariable=self.search_var, width=40,
                             bg=COL_EDIT_BG, fg=COL_EDIT_FG, font=FONT_DEFAULT,
                             insertbackground="white")
         search_entry.pack(side="left", padx=10)
@@ -2147,37 +2405,27 @@ class FaultEditor:
         search_entry.bind("<Return>", lambda e: self.next_search_result())
         search_entry.bind("<Escape>", lambda e: self.close_search())
 
-        # Initialiser les variables de recherche
-        self.search_results = []
-        self.current_search_index = -1
-
-        # Focus sur le champ de recherche
-        search_entry.focus_set()
-
     def close_search(self):
         """Ferme la barre de recherche hiérarchique"""
         if self.search_frame:
-            self.search_frame.destroy()
-            self.search_frame = None
+            # Masquée et non détruite : la réouverture n'a rien à reconstruire
+            self.search_frame.pack_forget()
         self.search_results = []
         self.current_search_index = -1
         self.clear_search_highlights()
 
     def clear_search_highlights(self):
         """Réinitialise les surlignages de recherche dans la vue hiérarchique"""
-        for column in self.columns:
-            # Utiliser enumerate pour obtenir l'index de chaque ligne
-            for idx, row in enumerate(column.winfo_children()):
-                if isinstance(row, tk.Frame):
-                    bg_color = COL_BG_ROW if idx % 2 == 1 else COL_BG_ROW_ALT
-                    row.configure(bg=bg_color)  # Configurer le bg du frame parent
-                    for widget in row.winfo_children():
-                        if isinstance(widget, (tk.Label, tk.Canvas)):
-                            widget.configure(bg=bg_color)
+        # Seule la ligne précédemment surlignée est repeinte, sans parcourir les colonnes
+        row = self.highlighted_row
+        self.highlighted_row = None
+        if row is None or not row.winfo_exists():
+            return
+        row.configure(bg=COL_BG_ROW)
 
     def search_as_you_type(self):
         """Recherche en temps réel dans la vue hiérarchique"""
-        search_text = self.search_var.get().strip().lower()
+        search_text = self.search_var.get().strip().casefold()
         if not search_text:
             self.search_results = []
             self.current_search_index = -1
@@ -2185,15 +2433,13 @@ class FaultEditor:
             self.results_label.config(text="")
             return
 
-        # Effectuer la recherche dans toutes les colonnes
+        # Effectuer la recherche dans les descriptions mises en cache par colonne
         results = []
         for column in self.columns:
-            for row in column.winfo_children():
-                if isinstance(row, tk.Frame):
-                    for widget in row.winfo_children():
-                        if isinstance(widget, tk.Label) and search_text in widget.cget("text").lower():
-                            results.append((column, row))
-                            break
+            rows = column._rows
+            for idx, description in enumerate(column._descriptions_cf):
+                if search_text in description:
+                    results.append((column, rows[idx]))
 
         self.search_results = results
         if results:
@@ -2209,10 +2455,8 @@ class FaultEditor:
         column, row = result
 
         # Mettre en surbrillance la ligne trouvée
-        row.configure(bg=COL_SEARCH_HIGHLIGHT)  # Configurer le bg du frame parent
-        for widget in row.winfo_children():
-            if isinstance(widget, (tk.Label, tk.Canvas)):
-                widget.configure(bg=COL_SEARCH_HIGHLIGHT)
+        row.configure(bg=COL_SEARCH_HIGHLIGHT)
+        self.highlighted_row = row
 
         # Mettre à jour le compteur de résultats
         if self.search_results:
@@ -2225,22 +2469,23 @@ class FaultEditor:
 
     def ensure_result_visible(self, column, row):
         """S'assure qu'un résultat de recherche est visible à l'écran"""
-        # Calculer les coordonnées de la ligne dans le canvas
-        bbox = self.main_canvas.bbox("all")
-        if not bbox:
+        # Hauteur du contenu mémorisée à la dernière mise à jour de la zone scrollable
+        content_height = self.content_height
+        if not content_height:
             return
 
         widget_y = row.winfo_y()
         canvas_height = self.main_canvas.winfo_height()
 
         # Obtenir les coordonnées actuelles de la vue
-        current_view_top = self.main_canvas.yview()[0] * bbox[3]
-        current_view_bottom = self.main_canvas.yview()[1] * bbox[3]
+        view_top, view_bottom = self.main_canvas.yview()
+        current_view_top = view_top * content_height
+        current_view_bottom = view_bottom * content_height
 
         # Si le widget n'est pas complètement visible, défiler jusqu'à lui
         if widget_y < current_view_top or widget_y + row.winfo_height() > current_view_bottom:
             # Calculer la nouvelle position de défilement pour centrer le résultat
-            new_y = (widget_y - (canvas_height / 2)) / bbox[3]
+            new_y = (widget_y - (canvas_height / 2)) / content_height
             # Limiter la position entre 0 et 1
             new_y = max(0, min(1, new_y))
             self.main_canvas.yview_moveto(new_y)
@@ -2267,13 +2512,11 @@ class FaultEditor:
             en_data = {}
             es_data = {}
 
-            for key in editor_window.all_keys:
-                for row_idx, k in enumerate(editor_window.all_keys, start=1):
-                    if k == key:
-                        fr_data[key] = editor_window.entry_vars[(row_idx, "fr")].get()
-                        en_data[key] = editor_window.entry_vars[(row_idx, "en")].get()
-                        es_data[key] = editor_window.entry_vars[(row_idx, "es")].get()
-                        break
+            # all_keys est sans doublon : la position de chaque clé donne directement sa ligne
+            for row_idx, key in enumerate(editor_window.all_keys, start=1):
+                fr_data[key] = editor_window.entry_vars[(row_idx, "fr")].get()
+                en_data[key] = editor_window.entry_vars[(row_idx, "en")].get()
+                es_data[key] = editor_window.entry_vars[(row_idx, "es")].get()
 
             # Sauvegarder les fichiers
             files_to_save = [                (editor_window.fr_path, fr_data),
@@ -2389,27 +2632,21 @@ if __name__ == "__main__":
         root.mainloop()
     except tk.TclError as e:
         print(f"❌ Erreur d'interface graphique Tkinter : {e}")
-        import traceback
         traceback.print_exc()
     except ImportError as e:
         print(f"❌ Erreur d'importation de module : {e}")
         print("Vérifiez que tous les modules requis sont installés")
-        import traceback
         traceback.print_exc()
     except FileNotFoundError as e:
         print(f"❌ Fichier de configuration ou ressource manquant : {e}")
-        import traceback
         traceback.print_exc()
     except PermissionError as e:
         print(f"❌ Erreur de permissions : {e}")
         print("Vérifiez les permissions d'accès aux dossiers et fichiers")
-        import traceback
         traceback.print_exc()
     except OSError as e:
         print(f"❌ Erreur système : {e}")
-        import traceback
         traceback.print_exc()
     except Exception as e:
         print(f"❌ Erreur fatale au démarrage : {e}")
-        import traceback
         traceback.print_exc()
@@ -6,6 +6,7 @@ Utilitaires pour la gestion robuste des erreurs
 
 import logging
 import functools
+import time
 import traceback
 import tkinter as tk
 from tkinter import messagebox
@@ -204,7 +205,6 @@ def retry_operation(max_retries: int = 3, delay: float = 0.5):
                     last_error = e
                     if attempt < max_retries - 1:
                         error_logger.warning(f"Tentative {attempt + 1} échouée pour {func.__name__}: {e}")
-                        import time
                         time.sleep(delay)
                     else:
                         error_logger.error(f"Toutes les tentatives échouées pour {func.__name__}: {e}")
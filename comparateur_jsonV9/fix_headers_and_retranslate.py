@@ -11,6 +11,9 @@ import json
 import argparse
 from translate import traduire
 
+# Champs numériques/booléens copiés tels quels (ensemble figé : test d'appartenance en O(1))
+CHAMPS_COPIES = frozenset(("Id", "IsExpandable", "CategoryId", "SubCategoryId", "FaultId"))
+
 def fix_headers_and_retranslate(source_file_path, force_retranslate=False):
     """
     Corrige les headers et retraduit les fichiers.
@@ -118,7 +121,7 @@ def sync_data_structure_with_force(source_data, target_data, source_lang, target
                 else:
                     # Garder la traduction existante
                     target_data[key] = target_data[key]
-            elif key in ["Id", "IsExpandable", "CategoryId", "SubCategoryId", "FaultId"]:
+            elif key in CHAMPS_COPIES:
                 # Copier les valeurs numériques et booléennes directement
                 target_data[key] = value
             else:
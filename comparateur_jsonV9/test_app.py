@@ -27,10 +27,22 @@ except ImportError as e:
 class TestFaultEditorBase(unittest.TestCase):
     """Classe de base pour les tests avec setup/teardown communs"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Une seule fenêtre racine par classe : créer un interpréteur Tk est coûteux"""
+        cls.root = tk.Tk()
+        cls.root.withdraw()  # Cacher la fenêtre pendant les tests
+
+    @classmethod
+    def tearDownClass(cls):
+        """Détruire la fenêtre racine partagée"""
+        try:
+            cls.root.destroy()
+        except tk.TclError:
+            pass
+
     def setUp(self):
         """Préparation avant chaque test"""
-        self.root = tk.Tk()
-        self.root.withdraw()  # Cacher la fenêtre pendant les tests
 
         # Créer un répertoire temporaire pour les tests
         self.temp_dir = tempfile.mkdtemp()
@@ -66,8 +78,12 @@ class TestFaultEditorBase(unittest.TestCase):
 
     def tearDown(self):
         """Nettoyage après chaque test"""
+        # Vider la racine partagée : callbacks after() en attente puis widgets créés par le test
         try:
-            self.root.destroy()
+            for job in self.root.tk.splitlist(self.root.tk.call('after', 'info')):
+                self.root.after_cancel(job)
+            for child in self.root.winfo_children():
+                child.destroy()
         except tk.TclError:
             pass
 
@@ -100,8 +116,10 @@ class TestFaultEditorInitialization(TestFaultEditorBase):
             'current_path', 'editing_info', 'status'
         ]
 
-        for attr in essential_attrs:
-            self.assertTrue(hasattr(app, attr), f"Attribut manquant: {attr}")
+        # Attributs d'instance : simple recherche dans vars(app), sans AttributeError levée et rattrapée
+        attributs = vars(app)
+        manquants = [attr for attr in essential_attrs if attr not in attributs]
+        self.assertEqual(manquants, [], f"Attributs manquants: {manquants}")
 
         print("✅ Test composants UI: PASS")
 
@@ -172,6 +190,23 @@ class TestFileOperations(TestFaultEditorBase):
         except Exception as e:
             self.fail(f"❌ Exception non gérée: {e}")
 
+    def test_load_json_cached(self):
+        """Test: Le cache de fichiers réutilise un fichier inchangé et relit un fichier modifié"""
+        app = FaultEditor(self.root)
+
+        first = app.load_json_cached(self.test_json_file)
+        second = app.load_json_cached(self.test_json_file)
+        self.assertIs(first, second)
+
+        # Modifier le fichier sur disque (taille différente) invalide l'entrée
+        modified = dict(self.test_data, FaultDetailList=[])
+        with open(self.test_json_file, 'w', encoding='utf-8') as f:
+            json.dump(modified, f)
+
+        reloaded = app.load_json_cached(self.test_json_file)
+        self.assertEqual(reloaded["FaultDetailList"], [])
+        print("✅ Test cache fichiers: PASS")
+
 class TestDataValidation(TestFaultEditorBase):
     """Tests de validation des données"""
 
@@ -249,6 +284,7 @@ class TestUIOperations(TestFaultEditorBase):
         result = app.path_to_filename(path)
 
         self.assertEqual(result, expected)
+        self.assertEqual(app.path_to_filename([7, 12]), "faults_007_012_fr.json")
         print("✅ Test génération nom fichier: PASS")
 
 class TestTranslationOperations(TestFaultEditorBase):
@@ -22,31 +22,26 @@ except ImportError as e:
 class TestFaultEditorMethods(unittest.TestCase):
     """Tests pour vérifier que les méthodes requises existent"""
 
-    def setUp(self):
-        """Préparation avant chaque test"""
-        self.root = tk.Tk()
-        self.root.withdraw()  # Cacher la fenêtre pendant les tests
-
-    def tearDown(self):
-        """Nettoyage après chaque test"""
-        try:
-            if hasattr(self, 'app') and self.app and hasattr(self.app, 'root'):
-                self.app.root.quit()
-                self.app.root.destroy()
-        except:
-            pass
+    @classmethod
+    def setUpClass(cls):
+        """Une seule app pour la classe : les tests ne font que de l'introspection"""
+        cls.root = tk.Tk()
+        cls.root.withdraw()  # Cacher la fenêtre pendant les tests
+        cls.app = FaultEditor(cls.root)
+        cls.attributes = set(dir(cls.app))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Nettoyage après tous les tests"""
         try:
-            if self.root:
-                self.root.quit()
-                self.root.destroy()
-        except:
+            cls.root.quit()
+            cls.root.destroy()
+        except tk.TclError:
             pass
 
     def test_app_has_current_methods(self):
         """Test que l'application a les méthodes de la version actuelle"""
         try:
-            self.app = FaultEditor(self.root)
-
             # Méthodes qui existent dans la version actuelle
             current_methods = [
                 'load_json_file',      # Existe toujours - charge un fichier JSON
@@ -55,14 +50,10 @@ class TestFaultEditorMethods(unittest.TestCase):
                 'setup_ui'             # Remplace create_widgets - initialise l'interface
             ]
 
-            missing_methods = []
-            existing_methods = []
-
-            for method_name in current_methods:
-                if hasattr(self.app, method_name):
-                    existing_methods.append(method_name)
-                else:
-                    missing_methods.append(method_name)
+            # Attributs de l'instance listés une seule fois dans setUpClass
+            attributes = self.attributes
+            existing_methods = [m for m in current_methods if m in attributes]
+            missing_methods = [m for m in current_methods if m not in attributes]
 
             print(f"✅ Méthodes existantes: {existing_methods}")
             if missing_methods:
@@ -80,8 +71,6 @@ class TestFaultEditorMethods(unittest.TestCase):
     def test_old_methods_removed(self):
         """Test que les anciennes méthodes ont bien été supprimées/remplacées"""
         try:
-            self.app = FaultEditor(self.root)
-
             # Anciennes méthodes qui n'existent plus
             old_methods = [
                 'save_json_file',      # Remplacée par save_file et save_flat_files
@@ -89,14 +78,9 @@ class TestFaultEditorMethods(unittest.TestCase):
                 'update_info_frame'    # Fonctionnalité refactorisée
             ]
 
-            existing_old_methods = []
-            removed_methods = []
-
-            for method_name in old_methods:
-                if hasattr(self.app, method_name):
-                    existing_old_methods.append(method_name)
-                else:
-                    removed_methods.append(method_name)
+            attributes = self.attributes
+            existing_old_methods = [m for m in old_methods if m in attributes]
+            removed_methods = [m for m in old_methods if m not in attributes]
 
             print(f"✅ Anciennes méthodes supprimées: {removed_methods}")
             if existing_old_methods:
@@ -62,12 +62,11 @@ class TestFaultEditorBasic(unittest.TestCase):
             'setup_ui'           # Replaces create_widgets
         ]
 
-        for method_name in required_methods:
-            with self.subTest(method=method_name):
-                self.assertTrue(
-                    hasattr(self.app, method_name) and callable(getattr(self.app, method_name)),
-                    f"Méthode manquante: {method_name}"
-                )
+        # One attribute listing, then set membership instead of a hasattr probe per name
+        present = set(dir(self.app))
+        missing = [name for name in required_methods
+                   if name not in present or not callable(getattr(self.app, name))]
+        self.assertEqual(missing, [], f"Méthodes manquantes: {missing}")
 
     def test_app_initialization(self):
         """Test that the app initializes properly."""
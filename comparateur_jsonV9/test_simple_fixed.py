@@ -68,9 +68,10 @@ class TestFaultEditorBasic(unittest.TestCase):
             'setup_ui'             # Remplace create_widgets
         ]
 
-        for method_name in required_methods:
-            self.assertTrue(hasattr(self.app, method_name),
-                          f"Méthode manquante: {method_name}")
+        # Une seule liste des attributs, puis appartenance à un ensemble pour chaque méthode
+        presentes = set(dir(self.app))
+        manquantes = [name for name in required_methods if name not in presentes]
+        self.assertEqual(manquantes, [], f"Méthodes manquantes: {manquantes}")
 
         print("✅ Toutes les méthodes requises sont présentes (version mise à jour)")
 
@@ -171,20 +172,22 @@ def run_quick_tests():
         print("✅ Votre application fonctionne correctement")
         return True
     else:
-        print(f"❌ {len(result.failures + result.errors)} problème(s) détecté(s)")
+        # Construire le rapport complet puis l'écrire en une seule fois
+        lignes = [f"❌ {len(result.failures + result.errors)} problème(s) détecté(s)"]
 
         if result.failures:
-            print("\n🔍 ÉCHECS:")
+            lignes.append("\n🔍 ÉCHECS:")
             for test, traceback in result.failures:
-                print(f"  - {test}")
-                print(f"    {traceback}")
+                lignes.append(f"  - {test}")
+                lignes.append(f"    {traceback}")
 
         if result.errors:
-            print("\n💥 ERREURS:")
+            lignes.append("\n💥 ERREURS:")
             for test, traceback in result.errors:
-                print(f"  - {test}")
-                print(f"    {traceback}")
+                lignes.append(f"  - {test}")
+                lignes.append(f"    {traceback}")
 
+        print("\n".join(lignes))
         return False
 
 def run_all_tests():
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests du correcteur orthographique des fichiers JSON français
+"""
+
+import unittest
+import os
+import sys
+import json
+import tempfile
+
+# Ajouter le répertoire parent au path pour importer le module
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from verifier_orthographe import VerificateurOrthographe, corriger_fichier_json, _iter_fichiers_fr
+
+
+class TestCorrigerTexte(unittest.TestCase):
+    """Tests de corriger_texte"""
+
+    def setUp(self):
+        self.verificateur = VerificateurOrthographe()
+
+    def test_texte_vide(self):
+        """Test: Un texte vide est retourné tel quel"""
+        self.assertEqual(self.verificateur.corriger_texte(""), ("", []))
+        self.assertEqual(self.verificateur.corriger_texte("   "), ("   ", []))
+        print("✅ Test texte vide: PASS")
+
+    def test_corrections_simples(self):
+        """Test: Plusieurs corrections sont appliquées en un seul passage"""
+        texte, corrections = self.verificateur.corriger_texte("Defaut capteur: arret du systeme")
+
+        self.assertEqual(texte, "Défaut capteur: arrêt du système")
+        self.assertEqual(corrections, ["'Defaut' → 'Défaut'", "'arret' → 'arrêt'", "'systeme' → 'système'"])
+        print("✅ Test corrections simples: PASS")
+
+    def test_cle_la_plus_longue(self):
+        """Test: La clé la plus longue l'emporte à une même position"""
+        texte, corrections = self.verificateur.corriger_texte("Moteur desactive a l'arret")
+
+        self.assertEqual(texte, "Moteur désactivé à l'arrêt")
+        self.assertEqual(corrections, ["'desactive' → 'désactivé'", "'a l'arret' → 'à l'arrêt'"])
+        print("✅ Test clé la plus longue: PASS")
+
+    def test_mots_entiers(self):
+        """Test: Une clé n'est pas remplacée à l'intérieur d'un autre mot"""
+        self.assertEqual(self.verificateur.corriger_texte("Consigne invalide"), ("Consigne invalide", []))
+        self.assertEqual(self.verificateur.corriger_texte("Sur la distance"), ("Sur la distance", []))
+        self.assertEqual(self.verificateur.corriger_texte("Avant l'arret"), ("Avant l'arrêt", ["'arret' → 'arrêt'"]))
+        print("✅ Test mots entiers: PASS")
+
+    def test_formes_flechies(self):
+        """Test: Pluriels et féminins des clés sont corrigés comme mots entiers"""
+        texte, _ = self.verificateur.corriger_texte("Capteurs detectes, donnees connectees, Desynchronisations")
+        self.assertEqual(texte, "Capteurs détectés, données connectées, Désynchronisations")
+
+        texte, _ = self.verificateur.corriger_texte("Le robot arrete, enonces creees")
+        self.assertEqual(texte, "Le robot arrête, énoncés créées")
+        print("✅ Test formes fléchies: PASS")
+
+    def test_mots_derives_non_corriges(self):
+        """Test: Les mots dérivés d'une clé (préfixe, autre terminaison) ne sont plus corrigés"""
+        # Compromis assumé des bornes de mot : seules les clés et leurs formes fléchies
+        # sont remplacées, plus les sous-chaînes de mots plus longs
+        self.assertEqual(self.verificateur.corriger_texte("arreter"), ("arreter", []))
+        self.assertEqual(self.verificateur.corriger_texte("deconnectes"), ("deconnectes", []))
+        print("✅ Test mots dérivés non corrigés: PASS")
+
+    def test_cache_partage(self):
+        """Test: Le résultat mis en cache n'est pas modifié par l'appelant"""
+        texte, corrections = self.verificateur.corriger_texte("Defaut moteur")
+        corrections.append("ajout local")
+
+        autre = VerificateurOrthographe()
+        self.assertEqual(autre.corriger_texte("Defaut moteur"), ("Défaut moteur", ["'Defaut' → 'Défaut'"]))
+        print("✅ Test cache partagé: PASS")
+
+    def test_guillemets_optionnels(self):
+        """Test: Les guillemets français ne sont appliqués que sur demande"""
+        self.assertEqual(self.verificateur.corriger_texte('Bouton "Start"'), ('Bouton "Start"', []))
+
+        verificateur = VerificateurOrthographe(guillemets_typographiques=True)
+        texte, _ = verificateur.corriger_texte('Bouton "Start"')
+        self.assertEqual(texte, "Bouton « Start »")
+        print("✅ Test guillemets optionnels: PASS")
+
+    def test_texte_correct(self):
+        """Test: Un texte déjà correct n'est pas modifié"""
+        texte, corrections = self.verificateur.corriger_texte("Batterie du véhicule déchargée")
+
+        self.assertEqual(texte, "Batterie du véhicule déchargée")
+        self.assertEqual(corrections, [])
+        print("✅ Test texte correct: PASS")
+
+
+class TestCorrigerFichierJson(unittest.TestCase):
+    """Tests de corriger_fichier_json"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.temp_dir.name, "faults_000_fr.json")
+        data = {"FaultDetailList": [{"Description": "Defaut capteur"}, {"Description": "Batterie faible"}]}
+        with open(self.filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def lire_descriptions(self):
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            return [fault["Description"] for fault in json.load(f)["FaultDetailList"]]
+
+    def test_correction_appliquee(self):
+        """Test: Les corrections sont retournées et écrites dans le fichier"""
+        filepath, corrections, modifie = corriger_fichier_json(self.filepath)
+
+        self.assertEqual(filepath, self.filepath)
+        self.assertTrue(modifie)
+        self.assertEqual([c.index for c in corrections], [0])
+        self.assertEqual(self.lire_descriptions(), ["Défaut capteur", "Batterie faible"])
+        print("✅ Test correction appliquée: PASS")
+
+    def test_simulation(self):
+        """Test: En simulation, le fichier n'est pas réécrit"""
+        _, corrections, modifie = corriger_fichier_json(self.filepath, appliquer=False)
+
+        self.assertTrue(modifie)
+        self.assertEqual(len(corrections), 1)
+        self.assertEqual(self.lire_descriptions(), ["Defaut capteur", "Batterie faible"])
+        print("✅ Test simulation: PASS")
+
+    def test_fichier_vide(self):
+        """Test: Un fichier vide est considéré comme sans correction"""
+        open(self.filepath, 'wb').close()
+
+        self.assertEqual(corriger_fichier_json(self.filepath), (self.filepath, [], False))
+        print("✅ Test fichier vide: PASS")
+
+    def test_parcours_dossiers(self):
+        """Test: Le parcours trouve les *_fr.json et ignore un dossier inexistant"""
+        self.assertEqual(list(_iter_fichiers_fr(self.temp_dir.name)), [self.filepath])
+        self.assertEqual(list(_iter_fichiers_fr(os.path.join(self.temp_dir.name, "absent"))), [])
+        print("✅ Test parcours dossiers: PASS")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from openai import OpenAI, OpenAIError
 from dotenv import load_dotenv
 import traceback
@@ -17,8 +18,16 @@ if not OPENAI_API_KEY:
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 TRANSLATION_TEMPERATURE = float(os.getenv("TRANSLATION_TEMPERATURE", "0.1"))
 
-# Configuration du client OpenAI
-client = OpenAI(api_key=OPENAI_API_KEY)
+# Client OpenAI, créé au premier appel de traduction seulement : les scripts qui importent
+# ce module sans traduire (simulation, vérifications) ne paient pas sa construction
+_client = None
+
+def get_client():
+    """Retourne le client OpenAI partagé, en le créant à la première utilisation"""
+    global _client
+    if _client is None:
+        _client = OpenAI(api_key=OPENAI_API_KEY)
+    return _client
 
 def traduire(text, target_lang):
     """
@@ -34,6 +43,22 @@ def traduire(text, target_lang):
     if not text or not text.strip():
         return text
 
+    try:
+        return _traduire_api(text, target_lang)
+    except OpenAIError as e:
+        print(f"Erreur lors de la traduction: {e}")  # handled for visibility
+        traceback.print_exc()
+        return text  # Retourner le texte original en cas d'erreur
+
+
+@lru_cache(maxsize=4096)
+def _traduire_api(text, target_lang):
+    """
+    Appel à l'API OpenAI, mémorisé par (texte, langue cible).
+
+    Les mêmes descriptions reviennent dans de nombreux fichiers : seul le premier
+    appel interroge l'API. Les erreurs (OpenAIError) ne sont pas mises en cache.
+    """
     # Définir les langues complètes
     lang_map = {
         'en': 'anglais',
@@ -43,12 +68,11 @@ def traduire(text, target_lang):
 
     target_language = lang_map.get(target_lang, target_lang)
 
-    try:
-        response = client.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[
-                {
-                    "role": "system",                    "content": f"""Tu es un traducteur expert spécialisé dans les systèmes industriels et véhicules guidés automatiquement (AGV). Tu dois traduire avec une précision technique absolue.
+    response = get_client().chat.completions.create(
+        model=OPENAI_MODEL,
+        messages=[
+            {
+                "role": "system",                    "content": f"""Tu es un traducteur expert spécialisé dans les systèmes industriels et véhicules guidés automatiquement (AGV). Tu dois traduire avec une précision technique absolue.
 
 CONTEXTE : Codes de défauts et messages d'erreur pour AGV industriels.
 
@@ -107,21 +131,16 @@ INSTRUCTIONS :
 - Ne donne QUE la traduction finale, sans explication
 
 Langue cible : {target_language}"""
-                },
-                {
-                    "role": "user",
-                    "content": text
-                }
-            ],
-            max_tokens=500,
-            temperature=TRANSLATION_TEMPERATURE
-        )
-
-        content = response.choices[0].message.content
-        translated_text = content.strip() if content else ""
-        return translated_text
-
-    except OpenAIError as e:
-        print(f"Erreur lors de la traduction: {e}")  # handled for visibility
-        traceback.print_exc()
-        return text  # Retourner le texte original en cas d'erreur
+            },
+            {
+                "role": "user",
+                "content": text
+            }
+        ],
+        max_tokens=500,
+        temperature=TRANSLATION_TEMPERATURE
+    )
+
+    content = response.choices[0].message.content
+    translated_text = content.strip() if content else ""
+    return translated_text
@@ -7,9 +7,20 @@ Script pour vérifier et corriger l'orthographe dans les fichiers JSON français
 
 import os
 import json
+import mmap
 import re
 import argparse
-from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+# Optionnel : orjson accélère la lecture et l'écriture des fichiers ; json reste utilisé sinon
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Dictionnaire des corrections orthographiques courantes
 CORRECTIONS_ORTHOGRAPHE = {
@@ -20,6 +31,8 @@ CORRECTIONS_ORTHOGRAPHE = {
     "arrets": "arrêts",
     "Arrets": "Arrêts",
     "ARRETS": "ARRÊTS",
+    "arrete": "arrête",
+    "Arrete": "Arrête",
 
     # Fautes de grammaire et conjugaison
     "reconnue": "reconnu",  # pour "Mouvement AMR non reconnue" -> "reconnu"
@@ -253,107 +266,147 @@ CORRECTIONS_ORTHOGRAPHE = {
     "A l'arrêt": "À l'arrêt",
 }
 
+# Les entrées identiques (« contacteur » → « contacteur ») ne corrigent rien : on les retire
+CORRECTIONS_ORTHOGRAPHE = {
+    incorrect: correct for incorrect, correct in CORRECTIONS_ORTHOGRAPHE.items() if incorrect != correct
+}
+
+# Formes fléchies dérivées de chaque clé : pluriel, et féminin (singulier et pluriel) pour les
+# participes en « é ». MOTIF_CORRECTIONS ne remplace que des mots entiers : sans ces formes,
+# « detectes » ou « connectees » ne seraient plus corrigés via « detecte » et « connecte ».
+# Les entrées écrites explicitement dans le dictionnaire restent prioritaires.
+def _formes_flechies(corrections: Dict[str, str]) -> Dict[str, str]:
+    formes = {}
+    for incorrect, correct in corrections.items():
+        if not incorrect[-1].isalpha() or incorrect[-1] in "sS":
+            continue
+        suffixes = ("s", "e", "es") if correct.endswith(("é", "É")) else ("s",)
+        for suffixe in suffixes:
+            if incorrect.isupper():
+                suffixe = suffixe.upper()
+            formes[incorrect + suffixe] = correct + suffixe
+    return formes
+
+CORRECTIONS_ORTHOGRAPHE = {**_formes_flechies(CORRECTIONS_ORTHOGRAPHE), **CORRECTIONS_ORTHOGRAPHE}
+
+# Toutes les corrections simples en une seule expression régulière, parcourue une fois par texte.
+# Les clés les plus longues passent en premier : à une même position, « a l'arret » l'emporte
+# sur « arret » et « desactive » sur « active ». Seuls des mots entiers sont remplacés, pour ne pas
+# transformer « la distance » en « là distance » ni « invalide » en « invalidé » ; les bornes sont
+# écrites en lookarounds plutôt qu'en \b car certaines clés (« aux. ») finissent par un non-mot.
+MOTIF_CORRECTIONS = re.compile(r"(?<!\w)(?:" + "|".join(
+    re.escape(incorrect) for incorrect in sorted(CORRECTIONS_ORTHOGRAPHE, key=len, reverse=True)
+) + r")(?!\w)")
+
 # Corrections spéciales (regex patterns)
-CORRECTIONS_REGEX = [
-    # Correction accord masculin/féminin pour certains contextes
-    (r'\bmouvement\s+\w+\s+non\s+reconnue\b', lambda m: m.group(0).replace('reconnue', 'reconnu')),
-    (r'\bversion\s+\w+\s+\w+\s+non\s+reconnue\b', lambda m: m.group(0).replace('reconnue', 'reconnue')),  # Version peut rester féminin
+# Motifs compilés une seule fois à l'import. Chaque motif est accompagné d'un déclencheur :
+# un littéral (en minuscules) sans lequel il ne peut pas correspondre, testé avec un simple « in ».
+CORRECTIONS_REGEX = [(re.compile(pattern, re.IGNORECASE), replacement, declencheur) for pattern, replacement, declencheur in [
+    # Correction accord masculin/féminin pour certains contextes (« version ... non reconnue » reste au féminin)
+    (r'\bmouvement\s+\w+\s+non\s+reconnue\b', lambda m: m.group(0).replace('reconnue', 'reconnu'), 'reconnue'),
 
     # Correction des espaces avant les deux-points
-    (r'\s+:', ':'),
+    (r'\s+:', ':', ':'),
+]]
 
-    # Correction des guillemets
-    (r'"([^"]*)"', r'« \1 »'),  # Optionnel : conversion en guillemets français
+# Optionnel : conversion en guillemets français, activée par VerificateurOrthographe(guillemets_typographiques=True)
+CORRECTIONS_REGEX_GUILLEMETS = CORRECTIONS_REGEX + [
+    (re.compile(r'"([^"]*)"'), r'« \1 »', '"'),
 ]
 
+# Pré-filtre appliqué aux octets bruts d'un fichier avant tout parsing JSON. Il doit trouver
+# au moins tout ce que _corriger_texte_cache peut corriger : les clés simples (sans bornes de
+# mot, donc plus large), « reconnue » sans casse, et un « : » précédé d'un blanc ASCII ou d'un
+# octet non ASCII (blancs Unicode). Les guillemets d'une description sont forcément échappés
+# en \" : les fichiers contenant un « \ » sont de toute façon parsés. À tenir à jour avec
+# CORRECTIONS_REGEX.
+MOTIF_OCTETS = re.compile(b"|".join(
+    [re.escape(incorrect.encode('utf-8')) for incorrect in sorted(CORRECTIONS_ORTHOGRAPHE, key=len, reverse=True)]
+    + [rb"(?i:reconnue)", rb"[\s\x80-\xff]:"]
+))
+
+@lru_cache(maxsize=65536)
+def _corriger_texte_cache(texte: str, guillemets_typographiques: bool = False) -> Tuple[str, Tuple[str, ...]]:
+    """Corrige un texte ; le cache est partagé entre fichiers, les descriptions se répétant souvent."""
+    if not texte or not texte.strip():
+        return texte, ()
+
+    # Remplacements sans doublon, dans l'ordre de première apparition
+    remplacements = {}
+
+    # Appliquer les corrections simples en un seul passage
+    def remplacer(match):
+        incorrect = match.group(0)
+        correct = CORRECTIONS_ORTHOGRAPHE[incorrect]
+        remplacements[incorrect] = correct
+        return correct
+
+    texte = MOTIF_CORRECTIONS.sub(remplacer, texte)
+    corrections_locales = [f"'{incorrect}' → '{correct}'" for incorrect, correct in remplacements.items()]
+
+    # Appliquer les corrections regex, en sautant celles dont le déclencheur est absent
+    regles = CORRECTIONS_REGEX_GUILLEMETS if guillemets_typographiques else CORRECTIONS_REGEX
+    texte_minuscules = texte.lower()
+    for motif, replacement, declencheur in regles:
+        if declencheur not in texte_minuscules:
+            continue
+
+        nouveau_texte = motif.sub(replacement, texte)
+
+        if nouveau_texte != texte:
+            corrections_locales.append(f"Pattern '{motif.pattern}' appliqué")
+            texte = nouveau_texte
+            texte_minuscules = texte.lower()
+
+    return texte, tuple(corrections_locales)
+
+class Correction(NamedTuple):
+    """Une description corrigée dans un fichier JSON français."""
+    fichier: str
+    index: int
+    avant: str
+    apres: str
+    corrections: Tuple[str, ...]
+
 class VerificateurOrthographe:
-    def __init__(self):
+    def __init__(self, guillemets_typographiques: bool = False):
+        self.guillemets_typographiques = guillemets_typographiques
         self.corrections_appliquees = []
         self.fichiers_modifies = []
 
     def corriger_texte(self, texte: str) -> Tuple[str, List[str]]:
         """Corrige l'orthographe d'un texte et retourne le texte corrigé et la liste des corrections."""
-        if not texte or not texte.strip():
-            return texte, []
-
-        texte_original = texte
-        corrections_locales = []
-
-        # Appliquer les corrections simples
-        for incorrect, correct in CORRECTIONS_ORTHOGRAPHE.items():
-            if incorrect in texte:
-                ancien_texte = texte
-                texte = texte.replace(incorrect, correct)
-                if texte != ancien_texte:
-                    corrections_locales.append(f"'{incorrect}' → '{correct}'")
-
-        # Appliquer les corrections regex
-        for pattern, replacement in CORRECTIONS_REGEX:
-            if isinstance(replacement, str):
-                nouveau_texte = re.sub(pattern, replacement, texte, flags=re.IGNORECASE)
-            else:
-                nouveau_texte = re.sub(pattern, replacement, texte, flags=re.IGNORECASE)
-
-            if nouveau_texte != texte:
-                corrections_locales.append(f"Pattern '{pattern}' appliqué")
-                texte = nouveau_texte
-
-        return texte, corrections_locales
+        texte_corrige, corrections = _corriger_texte_cache(texte, self.guillemets_typographiques)
+        return texte_corrige, list(corrections)
 
     def verifier_fichier_json(self, filepath: str) -> bool:
         """Vérifie et corrige un fichier JSON français."""
+        print(f"🔍 Vérification de {os.path.basename(filepath)}")
         try:
-            print(f"🔍 Vérification de {os.path.basename(filepath)}")
-
-            # Charger le fichier JSON
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            modifications = False
-            corrections_fichier = []
-
-            # Vérifier les descriptions dans FaultDetailList
-            if "FaultDetailList" in data:
-                for i, fault in enumerate(data["FaultDetailList"]):
-                    if "Description" in fault and fault["Description"]:
-                        description_originale = fault["Description"]
-                        description_corrigee, corrections = self.corriger_texte(description_originale)
-
-                        if description_corrigee != description_originale:
-                            fault["Description"] = description_corrigee
-                            modifications = True
-                            correction_info = {
-                                "fichier": os.path.basename(filepath),
-                                "index": i,
-                                "avant": description_originale,
-                                "après": description_corrigee,
-                                "corrections": corrections
-                            }
-                            corrections_fichier.append(correction_info)
-                            self.corrections_appliquees.append(correction_info)
-
-            # Sauvegarder si des modifications ont été faites
-            if modifications:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-
-                self.fichiers_modifies.append(filepath)
-                print(f"  ✅ {len(corrections_fichier)} correction(s) appliquée(s)")
-
-                # Afficher les corrections
-                for correction in corrections_fichier:
-                    print(f"    • Index {correction['index']}: '{correction['avant']}' → '{correction['après']}'")
-                    if correction['corrections']:
-                        print(f"      Détails: {', '.join(correction['corrections'])}")
-
-                return True
-            else:
-                print(f"  ✓ Aucune correction nécessaire")
-                return False
-
+            resultat = corriger_fichier_json(filepath, guillemets_typographiques=self.guillemets_typographiques)
         except Exception as e:
             print(f"  ❌ Erreur lors de la vérification de {filepath}: {e}")
             return False
+        return self.enregistrer_resultat(*resultat)
+
+    def enregistrer_resultat(self, filepath: str, corrections_fichier: List[Correction], modifie: bool) -> bool:
+        """Ajoute le résultat de corriger_fichier_json au bilan et l'affiche."""
+        self.corrections_appliquees.extend(corrections_fichier)
+
+        if modifie:
+            self.fichiers_modifies.append(filepath)
+            print(f"  ✅ {len(corrections_fichier)} correction(s) appliquée(s)")
+
+            # Afficher les corrections
+            for correction in corrections_fichier:
+                print(f"    • Index {correction.index}: '{correction.avant}' → '{correction.apres}'")
+                if correction.corrections:
+                    print(f"      Détails: {', '.join(correction.corrections)}")
+
+            return True
+        else:
+            print(f"  ✓ Aucune correction nécessaire")
+            return False
 
     def generer_rapport(self) -> str:
         """Génère un rapport des corrections effectuées."""
@@ -370,7 +423,7 @@ class VerificateurOrthographe:
 
             fichiers_groupes = {}
             for correction in self.corrections_appliquees:
-                fichier = correction["fichier"]
+                fichier = correction.fichier
                 if fichier not in fichiers_groupes:
                     fichiers_groupes[fichier] = []
                 fichiers_groupes[fichier].append(correction)
@@ -378,21 +431,125 @@ class VerificateurOrthographe:
             for fichier, corrections in fichiers_groupes.items():
                 rapport.append(f"\n### {fichier}")
                 for correction in corrections:
-                    rapport.append(f"  Index {correction['index']}:")
-                    rapport.append(f"    AVANT: {correction['avant']}")
-                    rapport.append(f"    APRÈS: {correction['après']}")
-                    if correction['corrections']:
-                        rapport.append(f"    DÉTAILS: {', '.join(correction['corrections'])}")
+                    rapport.append(f"  Index {correction.index}:")
+                    rapport.append(f"    AVANT: {correction.avant}")
+                    rapport.append(f"    APRÈS: {correction.apres}")
+                    if correction.corrections:
+                        rapport.append(f"    DÉTAILS: {', '.join(correction.corrections)}")
 
         return "\n".join(rapport)
 
-def main():
+def corriger_fichier_json(filepath: str, appliquer: bool = True,
+                          guillemets_typographiques: bool = False) -> Tuple[str, List[Correction], bool]:
+    """Corrige les descriptions d'un fichier JSON français.
+
+    Fonction de module sans état partagé, pour pouvoir être exécutée dans un processus
+    séparé. Retourne (filepath, corrections, modifié) ; le fichier n'est réécrit que si
+    appliquer est vrai et qu'au moins une description a changé.
+    """
+    # Parcourir les octets bruts (mmap, sans copie) : un fichier sans échappement ni motif
+    # candidat n'a rien à corriger, inutile de le parser
+    with open(filepath, 'rb') as f:
+        # Un fichier vide ne peut pas être mappé et n'a rien à corriger
+        if os.fstat(f.fileno()).st_size == 0:
+            return filepath, [], False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as contenu_mappe:
+            if contenu_mappe.find(b"\\") == -1 and not MOTIF_OCTETS.search(contenu_mappe):
+                return filepath, [], False
+            contenu = contenu_mappe[:]
+
+    # Charger le fichier JSON
+    if ORJSON_AVAILABLE:
+        data = orjson.loads(contenu)
+    else:
+        data = json.loads(contenu)
+
+    corrections_fichier = []
+    nom_fichier = Path(filepath).name
+
+    # Vérifier les descriptions dans FaultDetailList
+    if "FaultDetailList" in data:
+        for i, fault in enumerate(data["FaultDetailList"]):
+            if "Description" in fault and fault["Description"]:
+                description_originale = fault["Description"]
+                description_corrigee, corrections = _corriger_texte_cache(description_originale, guillemets_typographiques)
+
+                if description_corrigee != description_originale:
+                    fault["Description"] = description_corrigee
+                    corrections_fichier.append(Correction(
+                        nom_fichier, i, description_originale, description_corrigee, corrections
+                    ))
+
+    # Sauvegarder si des modifications ont été faites
+    modifie = bool(corrections_fichier)
+    if modifie and appliquer:
+        # OPT_INDENT_2 produit les mêmes octets que json.dumps(ensure_ascii=False, indent=2)
+        if ORJSON_AVAILABLE:
+            contenu = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            contenu = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+        # Écrire dans un fichier temporaire puis le renommer : le fichier d'origine n'est
+        # jamais laissé tronqué si l'écriture échoue
+        temp_file = filepath + ".tmp"
+        try:
+            with open(temp_file, 'wb') as f:
+                f.write(contenu)
+            os.replace(temp_file, filepath)
+        except OSError:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+
+    return filepath, corrections_fichier, modifie
+
+def _iter_fichiers_fr(chemin: str):
+    """Parcourt récursivement chemin et produit les fichiers *_fr.json, sans stat supplémentaire."""
+    try:
+        entrees = os.scandir(chemin)
+    except OSError:
+        # Dossier illisible ou disparu : ignoré, comme le faisait os.walk
+        return
+    with entrees:
+        for entree in entrees:
+            if entree.is_dir(follow_symlinks=False):
+                yield from _iter_fichiers_fr(entree.path)
+            elif entree.name.endswith('_fr.json'):
+                yield entree.path
+
+def _iter_resultats(fichiers: List[str], jobs: int, appliquer: bool, guillemets_typographiques: bool):
+    """Produit (fichier, résultat ou exception) dans l'ordre de fichiers.
+
+    Séquentiel par défaut : démarrer des interpréteurs coûte plus cher que corriger
+    quelques dizaines de fichiers, presque tous écartés par le pré-filtre.
+    """
+    if jobs <= 1:
+        for fichier in fichiers:
+            try:
+                yield fichier, corriger_fichier_json(fichier, appliquer, guillemets_typographiques)
+            except Exception as e:
+                yield fichier, e
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(corriger_fichier_json, fichier, appliquer, guillemets_typographiques)
+                   for fichier in fichiers]
+        for fichier, future in zip(fichiers, futures):
+            try:
+                yield fichier, future.result()
+            except Exception as e:
+                yield fichier, e
+
+def main(argv=None):
     parser = argparse.ArgumentParser(description='Vérifier et corriger l\'orthographe dans les fichiers JSON français')
     parser.add_argument('base_dir', help='Répertoire de base contenant les fichiers JSON')
     parser.add_argument('--dry-run', action='store_true', help='Afficher les corrections sans les appliquer')
     parser.add_argument('--rapport', help='Fichier pour sauvegarder le rapport de corrections')
+    parser.add_argument('--guillemets', action='store_true', help='Convertir les guillemets droits en guillemets français')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Nombre de processus (1 = séquentiel, par défaut ; 0 = un par cœur)')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not os.path.exists(args.base_dir):
         print(f"❌ Répertoire introuvable : {args.base_dir}")
@@ -401,11 +558,7 @@ def main():
     print(f"🔍 Recherche des fichiers JSON français dans : {args.base_dir}")
 
     # Trouver tous les fichiers JSON français
-    fichiers_fr = []
-    for root, dirs, files in os.walk(args.base_dir):
-        for file in files:
-            if file.endswith('_fr.json'):
-                fichiers_fr.append(os.path.join(root, file))
+    fichiers_fr = list(_iter_fichiers_fr(args.base_dir))
 
     if not fichiers_fr:
         print("❌ Aucun fichier JSON français trouvé")
@@ -416,44 +569,32 @@ def main():
     if args.dry_run:
         print("🔍 MODE SIMULATION (dry-run) - Aucune modification ne sera effectuée")
 
-    verificateur = VerificateurOrthographe()
+    verificateur = VerificateurOrthographe(args.guillemets)
+    base = Path(args.base_dir)
+
+    # Les résultats sont affichés et fusionnés ici dans l'ordre de la liste, que les fichiers
+    # soient traités sur place ou dans un pool de processus (--jobs)
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count()
+    resultats = _iter_resultats(fichiers_fr, jobs, not args.dry_run, args.guillemets)
 
-    # Traiter chaque fichier
-    for i, fichier in enumerate(fichiers_fr, 1):
-        print(f"\n[{i}/{len(fichiers_fr)}] {os.path.relpath(fichier, args.base_dir)}")
+    for i, (fichier, resultat) in enumerate(resultats, 1):
+        print(f"\n[{i}/{len(fichiers_fr)}] {Path(fichier).relative_to(base)}")
+
+        if isinstance(resultat, Exception):
+            print(f"  ❌ Erreur lors de la vérification de {fichier}: {resultat}")
+            continue
 
         if not args.dry_run:
-            verificateur.verifier_fichier_json(fichier)
+            verificateur.enregistrer_resultat(*resultat)
         else:
-            # Mode simulation - juste vérifier sans modifier
-            try:
-                with open(fichier, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                corrections_simulees = []
-                if "FaultDetailList" in data:
-                    for j, fault in enumerate(data["FaultDetailList"]):
-                        if "Description" in fault and fault["Description"]:
-                            description_originale = fault["Description"]
-                            description_corrigee, corrections = verificateur.corriger_texte(description_originale)
-
-                            if description_corrigee != description_originale:
-                                corrections_simulees.append({
-                                    "index": j,
-                                    "avant": description_originale,
-                                    "après": description_corrigee,
-                                    "corrections": corrections
-                                })
-
-                if corrections_simulees:
-                    print(f"  🔍 {len(corrections_simulees)} correction(s) possible(s):")
-                    for correction in corrections_simulees:
-                        print(f"    • Index {correction['index']}: '{correction['avant']}' → '{correction['après']}'")
-                else:
-                    print(f"  ✓ Aucune correction nécessaire")
-
-            except Exception as e:
-                print(f"  ❌ Erreur lors de la lecture de {fichier}: {e}")
+            # Mode simulation - rien n'a été écrit
+            _, corrections_simulees, _ = resultat
+            if corrections_simulees:
+                print(f"  🔍 {len(corrections_simulees)} correction(s) possible(s):")
+                for correction in corrections_simulees:
+                    print(f"    • Index {correction.index}: '{correction.avant}' → '{correction.apres}'")
+            else:
+                print(f"  ✓ Aucune correction nécessaire")
 
     # Générer et afficher le rapport
     if not args.dry_run: